@@ -5,14 +5,18 @@ This module contains routes for handling user authentication
 including GitHub OAuth flow.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Cookie
-from fastapi.responses import RedirectResponse, JSONResponse
+from fastapi.responses import RedirectResponse, ORJSONResponse
 
-from src.auth.jwt import create_access_token, get_current_user, decode_token, get_token_from_request
+from src.auth.jwt import (
+    create_access_token, create_access_token_with_exp, get_current_user,
+    decode_token, get_token_from_request
+)
 from src.auth.github import (
     get_github_login_url, get_github_oauth_token, get_github_user,
     create_or_get_user_from_github, GitHubAuthError
@@ -24,6 +28,29 @@ from src.schemas.models import ErrorResponse, TokenResponse
 settings = get_settings()
 logger = logging.getLogger("algelab.api.auth")
 
+# Values derived from settings once at import instead of on every request
+ACCESS_TOKEN_EXPIRE_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+LOGIN_SUCCESS_URL = f"{settings.FRONTEND_URL}/anh-algelab"
+AUTH_ERROR_URL = f"{settings.FRONTEND_URL}/auth-error"
+
+# Cookie policy for the JWT cookie, shared by every endpoint that sets or clears it
+_COOKIE_DEL_KW: Dict[str, Any] = {
+    "key": JWT_TOKEN_COOKIE_NAME,
+    "path": "/",
+    "secure": settings.COOKIE_SECURE,
+    "httponly": settings.COOKIE_HTTPONLY,
+    "samesite": settings.COOKIE_SAMESITE,
+}
+_COOKIE_KW: Dict[str, Any] = {**_COOKIE_DEL_KW, "max_age": settings.COOKIE_MAX_AGE}
+
+# Failed validations must never be reused by an intermediary
+VALIDATE_TOKEN_FAILURE_HEADERS = {"Cache-Control": "no-store"}
+
+# OAuth callbacks currently being processed, keyed by authorization code.
+# Entries are removed as soon as the callback finishes, so the dict only
+# ever holds in-flight codes.
+inflight_callbacks: Dict[str, asyncio.Task] = {}
+
 router = APIRouter(
     tags=["authentication"],
     responses={
@@ -51,6 +78,11 @@ async def github_callback(code: str, request: Request):
     """
     Handle GitHub OAuth callback.
     
+    Concurrent callbacks for the same code (e.g. a browser firing the
+    redirect twice) share one login task instead of exchanging the
+    single-use code again. No request owns the task, so a client that
+    disconnects does not cancel the login for the others.
+    
     Args:
         code: Authorization code from GitHub
         request: FastAPI request object
@@ -58,12 +90,32 @@ async def github_callback(code: str, request: Request):
     Returns:
         Redirect to frontend with JWT token set as cookie
     """
+    task = inflight_callbacks.get(code)
+    if task is None:
+        task = asyncio.create_task(complete_github_login(code))
+        inflight_callbacks[code] = task
+        task.add_done_callback(lambda _: inflight_callbacks.pop(code, None))
+    
+    return await asyncio.shield(task)
+
+
+async def complete_github_login(code: str) -> Response:
+    """
+    Exchange a GitHub OAuth code for a signed-in redirect response.
+    
+    Args:
+        code: Authorization code from GitHub
+        
+    Returns:
+        Redirect to frontend with JWT token set as cookie, or to the
+        frontend error page if authentication failed
+    """
     try:
         # Exchange code for GitHub access token
         github_token = await get_github_oauth_token(code)
         
         # Get GitHub user information
-        github_user = await get_github_user(github_token.access_token)
+        github_user = await get_github_user(github_token)
         
         # Create or get user from database
         user = await create_or_get_user_from_github(github_user)
@@ -71,68 +123,49 @@ async def github_callback(code: str, request: Request):
         # Create JWT token
         token = create_access_token(
             subject=user["user_id"],
-            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+            expires_delta=ACCESS_TOKEN_EXPIRE_DELTA
         )
         
         # Create response with redirect
-        response = RedirectResponse(url=f"{settings.FRONTEND_URL}/anh-algelab")
+        response = RedirectResponse(url=LOGIN_SUCCESS_URL)
         
         # Set JWT token as cookie
-        response.set_cookie(
-            key=JWT_TOKEN_COOKIE_NAME,
-            value=token,
-            max_age=settings.COOKIE_MAX_AGE,
-            httponly=settings.COOKIE_HTTPONLY,
-            secure=settings.COOKIE_SECURE,
-            samesite=settings.COOKIE_SAMESITE,
-            path="/",
-        )
+        response.set_cookie(value=token, **_COOKIE_KW)
         
         # Log successful authentication
-        logger.info(f"User {user['user_id']} authenticated successfully via GitHub")
+        logger.info("User %s authenticated successfully via GitHub", user["user_id"])
         
         return response
         
     except GitHubAuthError as e:
-        logger.error(f"GitHub authentication error: {str(e)}")
+        logger.error("GitHub authentication error: %s", e)
         return RedirectResponse(
-            url=f"{settings.FRONTEND_URL}/auth-error?error={str(e)}",
+            url=f"{AUTH_ERROR_URL}?error={str(e)}",
             status_code=status.HTTP_302_FOUND
         )
     except Exception as e:
-        logger.exception(f"Unexpected error in GitHub callback: {str(e)}")
+        logger.exception("Unexpected error in GitHub callback: %s", e)
         return RedirectResponse(
-            url=f"{settings.FRONTEND_URL}/auth-error?error=Authentication+failed",
+            url=f"{AUTH_ERROR_URL}?error=Authentication+failed",
             status_code=status.HTTP_302_FOUND
         )
 
 
-@router.post("/logout", status_code=200)
-async def logout(
-    response: Response,
-    current_user: Dict[str, Any] = Depends(get_current_user)
-):
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout():
     """
     Logout user by clearing the JWT token cookie.
     
-    Args:
-        response: FastAPI response object
-        current_user: Current authenticated user
-        
+    No authentication is required: clearing the cookie is idempotent, and
+    clients holding an expired token must still be able to log out.
+    
     Returns:
-        Success message
+        Empty 204 response that deletes the token cookie
     """
-    logger.info(f"User {current_user['user_id']} logged out")
-    
-    response.delete_cookie(
-        key=JWT_TOKEN_COOKIE_NAME,
-        path="/",
-        secure=settings.COOKIE_SECURE,
-        httponly=settings.COOKIE_HTTPONLY,
-        samesite=settings.COOKIE_SAMESITE
-    )
+    response = Response(status_code=status.HTTP_204_NO_CONTENT)
+    response.delete_cookie(**_COOKIE_DEL_KW)
     
-    return {"message": "Successfully logged out"}
+    return response
 
 
 @router.get("/token", response_model=TokenResponse)
@@ -178,18 +211,20 @@ async def validate_token(request: Request):
     token = get_token_from_request(request)
     
     if not token:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"valid": False, "error": "No token provided"}
+            content={"valid": False, "error": "No token provided"},
+            headers=VALIDATE_TOKEN_FAILURE_HEADERS,
         )
     
     try:
         payload = decode_token(token)
-        return {"valid": True, "user_id": payload["sub"]}
+        return ORJSONResponse({"valid": True, "user_id": payload["sub"]})
     except HTTPException as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            content={"valid": False, "error": e.detail}
+            content={"valid": False, "error": e.detail},
+            headers=VALIDATE_TOKEN_FAILURE_HEADERS,
         )
 
 
@@ -211,26 +246,15 @@ async def refresh_token(
         Success message with new token expiration
     """
     # Create new token
-    new_token = create_access_token(
+    new_token, expires_at = create_access_token_with_exp(
         subject=current_user["user_id"],
-        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expires_delta=ACCESS_TOKEN_EXPIRE_DELTA
     )
     
     # Set new cookie
-    response.set_cookie(
-        key=JWT_TOKEN_COOKIE_NAME,
-        value=new_token,
-        max_age=settings.COOKIE_MAX_AGE,
-        httponly=settings.COOKIE_HTTPONLY,
-        secure=settings.COOKIE_SECURE,
-        samesite=settings.COOKIE_SAMESITE,
-        path="/",
-    )
-    
-    # Decode token to get expiration
-    payload = decode_token(new_token)
+    response.set_cookie(value=new_token, **_COOKIE_KW)
     
     return {
         "message": "Token refreshed successfully",
-        "expires_at": payload["exp"]
+        "expires_at": expires_at
     }
\ No newline at end of file
@@ -5,20 +5,28 @@ This module contains routes for handling user information
 and profile management.
 """
 
+import hashlib
 import logging
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import ORJSONResponse
 
 from src.auth.jwt import get_current_user
-from src.db.client import get_db_client, SupabaseClientError
+from src.config.constants import GITHUB_AVATAR_URL
+from src.db.client import get_db_client
+from src.db.exceptions import SupabaseClientError
 from src.schemas.models import UserInfo, ErrorResponse
 
 logger = logging.getLogger("algelab.api.users")
-db_client = get_db_client()
+# Browsers must revalidate every time (the ETag makes that a cheap 304)
+# and key the cached copy on the credentials that selected the user
+USER_INFO_CACHE_CONTROL = "private, no-cache"
+USER_INFO_VARY = "Cookie, Authorization"
 
 router = APIRouter(
     tags=["users"],
+    default_response_class=ORJSONResponse,
     responses={
         401: {"model": ErrorResponse, "description": "Unauthorized"},
         403: {"model": ErrorResponse, "description": "Forbidden"},
@@ -28,9 +36,28 @@ router = APIRouter(
 )
 
 
+def get_user_etag(user: Dict[str, Any]) -> str:
+    """
+    Build a weak ETag for the user info payload.
+    
+    Args:
+        user: User profile row from the database
+        
+    Returns:
+        Weak ETag derived from the fields exposed by the endpoint
+    """
+    fingerprint = "|".join(
+        str(user.get(key) or "")
+        for key in ("user_id", "github_username", "first_name", "last_name", "updated_at")
+    )
+    digest = hashlib.blake2b(fingerprint.encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
 @router.get("/", response_model=UserInfo)
 async def get_user_info(
     request: Request,
+    response: Response,
     current_user: Dict[str, Any] = Depends(get_current_user)
 ):
     """
@@ -38,47 +65,60 @@ async def get_user_info(
     
     Args:
         request: FastAPI request object
+        response: FastAPI response object
         current_user: Current authenticated user
         
     Returns:
-        UserInfo object with user profile information
+        User profile information matching UserInfo, or an empty
+        304 response if the client's cached copy is still current
         
     Raises:
         HTTPException: If user not found or database error
     """
     try:
         user_id = current_user["user_id"]
-        user = db_client.get_user(user_id)
+        user = await get_db_client().get_user(user_id)
         
         if not user:
-            logger.warning(f"User not found in database: {user_id}")
+            logger.warning("User not found in database: %s", user_id)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found"
             )
         
+        # Let the client reuse its cached copy when nothing changed
+        cache_headers = {
+            "ETag": get_user_etag(user),
+            "Cache-Control": USER_INFO_CACHE_CONTROL,
+            "Vary": USER_INFO_VARY,
+        }
+        if request.headers.get("if-none-match") == cache_headers["ETag"]:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers)
+        response.headers.update(cache_headers)
+        
         # Generate avatar URL
         avatar_url = None
         if user.get("github_username"):
-            avatar_url = f"https://github.com/{user['github_username']}.png"
+            avatar_url = GITHUB_AVATAR_URL.format(user["github_username"])
         
-        # Prepare response
-        return UserInfo(
-            user_id=user_id,
-            username=user.get("github_username", ""),
-            first_name=user.get("first_name"),
-            last_name=user.get("last_name"),
-            avatar_url=avatar_url
-        )
+        # Prepare response; FastAPI validates it against UserInfo once via
+        # the route's prebuilt response_model validator
+        return {
+            "user_id": user_id,
+            "username": user.get("github_username", ""),
+            "first_name": user.get("first_name"),
+            "last_name": user.get("last_name"),
+            "avatar_url": avatar_url,
+        }
         
     except SupabaseClientError as e:
-        logger.error(f"Database error when fetching user info: {str(e)}")
+        logger.error("Database error when fetching user info: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Database error: {str(e)}"
         )
     except Exception as e:
-        logger.exception(f"Unexpected error in get_user_info: {str(e)}")
+        logger.exception("Unexpected error in get_user_info: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Internal server error: {str(e)}"
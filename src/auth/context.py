@@ -0,0 +1,15 @@
+"""
+Per-request authentication context.
+
+AppMiddleware decodes the request's token once and publishes the
+payload here; dependencies such as get_current_user read it back
+without touching request.state or decoding the token again.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+# Decoded JWT payload of the current request, or None if unauthenticated.
+# Each ASGI request runs in its own task, so values never leak between
+# requests; threadpool dependencies see it through the copied context.
+jwt_payload_var: ContextVar[Optional[Dict[str, Any]]] = ContextVar("jwt_payload", default=None)
@@ -5,39 +5,87 @@ This module provides utilities for handling GitHub OAuth authentication
 including login flow, callback processing, and user creation.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
-import requests
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from urllib.parse import urlencode
 
+import httpx
 from fastapi import HTTPException, status
 
 from src.config import get_settings
-from src.config.constants import GITHUB_AUTH_URL, GITHUB_TOKEN_URL, GITHUB_API_URL
-from src.schemas.models import GitHubOAuthResponse, GitHubUser
+from src.config.constants import (
+    GITHUB_AUTH_URL, GITHUB_TOKEN_URL, GITHUB_API_URL, GITHUB_REQUEST_TIMEOUT
+)
+from src.schemas.models import GitHubUser
 from src.db.client import get_db_client
 from src.auth.exceptions import GitHubAuthError
 
 settings = get_settings()
 logger = logging.getLogger("algelab.auth.github")
-db_client = get_db_client()
 
+_github_client: Optional[httpx.AsyncClient] = None
 
+
+def get_github_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client used for GitHub requests.
+    
+    The client is created on first use so that keep-alive connections
+    to github.com and api.github.com are reused across OAuth callbacks
+    without blocking the event loop. HTTP/2 lets the token exchange and
+    the /user and /user/emails lookups share one connection per host.
+    
+    Returns:
+        httpx.AsyncClient configured for the GitHub API
+    """
+    global _github_client
+    
+    if _github_client is None:
+        _github_client = httpx.AsyncClient(
+            http2=True,
+            headers={'Accept': 'application/json'},
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+            timeout=httpx.Timeout(GITHUB_REQUEST_TIMEOUT, connect=5.0),
+        )
+    
+    return _github_client
+
+
+async def close_github_client() -> None:
+    """Close the shared GitHub HTTP client and release its connections."""
+    global _github_client
+    
+    if _github_client is not None:
+        await _github_client.aclose()
+        _github_client = None
+
+
+@lru_cache(maxsize=1)
 def get_github_login_url() -> str:
     """
     Generate GitHub OAuth login URL.
     
+    All inputs come from settings, so the URL is built once and reused;
+    call get_github_login_url.cache_clear() if settings are swapped.
+    
     Returns:
         GitHub OAuth authorization URL
     """
-    return (
-        f"{GITHUB_AUTH_URL}"
-        f"?client_id={settings.GITHUB_CLIENT_ID}"
-        f"&redirect_uri={settings.GITHUB_REDIRECT_URI}"
-        f"&scope=user"
-    )
+    query = urlencode({
+        "client_id": settings.GITHUB_CLIENT_ID,
+        "redirect_uri": settings.GITHUB_REDIRECT_URI,
+        "scope": "user",
+    })
+    return f"{GITHUB_AUTH_URL}?{query}"
 
 
-async def get_github_oauth_token(code: str) -> GitHubOAuthResponse:
+async def get_github_oauth_token(code: str) -> str:
     """
     Exchange OAuth code for GitHub access token.
     
@@ -45,21 +93,20 @@ async def get_github_oauth_token(code: str) -> GitHubOAuthResponse:
         code: OAuth authorization code from GitHub
         
     Returns:
-        GitHubOAuthResponse with access token
+        GitHub access token
         
     Raises:
         GitHubAuthError: If token exchange fails
     """
     try:
-        response = requests.post(
+        response = await get_github_client().post(
             GITHUB_TOKEN_URL,
             data={
                 'client_id': settings.GITHUB_CLIENT_ID,
                 'client_secret': settings.GITHUB_CLIENT_SECRET,
                 'code': code,
                 'redirect_uri': settings.GITHUB_REDIRECT_URI,
-            },
-            headers={'Accept': 'application/json'}
+            }
         )
         
         response.raise_for_status()
@@ -67,17 +114,17 @@ async def get_github_oauth_token(code: str) -> GitHubOAuthResponse:
         
         # Check for error response
         if "error" in response_data:
-            logger.error(f"GitHub OAuth error: {response_data.get('error_description', 'Unknown error')}")
+            logger.error("GitHub OAuth error: %s", response_data.get("error_description", "Unknown error"))
             raise GitHubAuthError(response_data.get("error_description", "Failed to obtain access token"))
         
         # Validate required fields
         if "access_token" not in response_data:
             raise GitHubAuthError("No access token in GitHub response")
         
-        return GitHubOAuthResponse(**response_data)
+        return response_data["access_token"]
     
-    except requests.RequestException as e:
-        logger.error(f"GitHub OAuth token request failed: {str(e)}")
+    except httpx.HTTPError as e:
+        logger.error("GitHub OAuth token request failed: %s", e)
         raise GitHubAuthError(f"Failed to obtain GitHub token: {str(e)}")
 
 
@@ -94,14 +141,19 @@ async def get_github_user(access_token: str) -> GitHubUser:
     Raises:
         GitHubAuthError: If user data fetch fails
     """
+    client = get_github_client()
+    headers = {'Authorization': f'token {access_token}'}
+    
     try:
-        response = requests.get(
-            f"{GITHUB_API_URL}/user",
-            headers={
-                'Authorization': f'token {access_token}',
-                'Accept': 'application/json'
-            }
+        # Fetch the profile and the email list concurrently; the emails
+        # response is only used when the profile email is private
+        response, emails_response = await asyncio.gather(
+            client.get(f"{GITHUB_API_URL}/user", headers=headers),
+            client.get(f"{GITHUB_API_URL}/user/emails", headers=headers),
+            return_exceptions=True,
         )
+        if isinstance(response, BaseException):
+            raise response
         
         response.raise_for_status()
         user_data = response.json()
@@ -109,13 +161,8 @@ async def get_github_user(access_token: str) -> GitHubUser:
         # Get additional email information if not provided in profile
         if not user_data.get("email"):
             try:
-                emails_response = requests.get(
-                    f"{GITHUB_API_URL}/user/emails",
-                    headers={
-                        'Authorization': f'token {access_token}',
-                        'Accept': 'application/json'
-                    }
-                )
+                if isinstance(emails_response, BaseException):
+                    raise emails_response
                 
                 if emails_response.status_code == 200:
                     emails = emails_response.json()
@@ -123,12 +170,19 @@ async def get_github_user(access_token: str) -> GitHubUser:
                     if primary_email:
                         user_data["email"] = primary_email.get("email")
             except Exception as e:
-                logger.warning(f"Failed to fetch GitHub user emails: {str(e)}")
-        
-        return GitHubUser(**user_data)
+                logger.warning("Failed to fetch GitHub user emails: %s", e)
+        
+        # Only the fields used downstream are kept; the payload comes
+        # straight from GitHub, so full model validation is skipped
+        return GitHubUser.model_construct(
+            login=user_data["login"],
+            id=user_data["id"],
+            name=user_data.get("name"),
+            email=user_data.get("email"),
+        )
     
-    except requests.RequestException as e:
-        logger.error(f"GitHub user request failed: {str(e)}")
+    except httpx.HTTPError as e:
+        logger.error("GitHub user request failed: %s", e)
         raise GitHubAuthError(f"Failed to fetch GitHub user: {str(e)}")
 
 
@@ -146,28 +200,24 @@ async def create_or_get_user_from_github(github_user: GitHubUser) -> Dict[str, A
         HTTPException: If user creation/update fails
     """
     try:
-        # Check if user exists by GitHub username
-        existing_user = db_client.get_user_by_github_username(github_user.login)
-        
         # Create user data
+        name_parts = github_user.name.split(maxsplit=1) if github_user.name else []
         user_data = {
             "github_username": github_user.login,
-            "first_name": github_user.name.split()[0] if github_user.name else None,
-            "last_name": github_user.name.split(maxsplit=1)[1] if github_user.name and len(github_user.name.split()) > 1 else None,
+            "first_name": name_parts[0] if name_parts else None,
+            "last_name": name_parts[1] if len(name_parts) > 1 else None,
         }
         
-        if existing_user:
-            # Update existing user
-            user = db_client.create_or_update_user(existing_user["user_id"], user_data)
-        else:
-            # Create new user ID (using GitHub ID as reference)
-            user_id = f"github_{github_user.id}"
-            user = db_client.create_or_update_user(user_id, user_data)
+        # Key the profile on the immutable GitHub ID so renamed accounts
+        # update their existing row instead of colliding on user_id
+        user = await get_db_client().create_or_update_user(
+            f"github_{github_user.id}", user_data
+        )
         
         return user
     
     except Exception as e:
-        logger.error(f"Failed to create or update user from GitHub: {str(e)}")
+        logger.error("Failed to create or update user from GitHub: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to create or update user: {str(e)}"
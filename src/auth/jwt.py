@@ -5,52 +5,232 @@ This module provides functions for creating, validating, and handling
 JWT tokens for user authentication.
 """
 
+import base64
+import hashlib
+import hmac
 import logging
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
-from fastapi import Depends, HTTPException, Request, status
-from fastapi.security import OAuth2PasswordBearer
-from jwt.exceptions import InvalidTokenError, ExpiredSignatureError
+import orjson
+from cachetools import TTLCache
+from fastapi import HTTPException, Request, status
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import (
+    DecodeError,
+    ExpiredSignatureError,
+    ImmatureSignatureError,
+    InvalidAudienceError,
+    InvalidIssuedAtError,
+    InvalidJTIError,
+    InvalidSignatureError,
+    InvalidSubjectError,
+    InvalidTokenError,
+    MissingRequiredClaimError,
+)
 
+from src.auth.context import jwt_payload_var
 from src.config import get_settings
-from src.config.constants import JWT_TOKEN_COOKIE_NAME
-from src.schemas.models import TokenPayload
+from src.config.constants import (
+    JWT_TOKEN_COOKIE_NAME,
+    TOKEN_CACHE_MAXSIZE,
+    TOKEN_CACHE_TTL,
+)
 
 settings = get_settings()
 logger = logging.getLogger("algelab.security")
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/token", auto_error=False)
+# Signing parameters resolved once; settings are fixed for the process lifetime.
+# The key is run through the algorithm's prepare_key up front so the per-call
+# preparation inside PyJWT only sees ready-made key bytes.
+_ALG = settings.ALGORITHM
+_SECRET = get_default_algorithms()[_ALG].prepare_key(settings.SECRET_KEY)
+_ALGS = [_ALG]
+_DEFAULT_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_DECODE_OPTIONS = {"require": ["exp", "sub"], "verify_exp": True}
 
+# HMAC algorithms are signed directly with hashlib/hmac; the JOSE header is
+# constant so its base64url form is computed once. Other algorithms go
+# through PyJWT.
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+_DIGEST = _HMAC_DIGESTS.get(_ALG)
+_HEADER_B64 = base64.urlsafe_b64encode(
+    orjson.dumps({"alg": _ALG, "typ": "JWT"})
+).rstrip(b"=")
+# Tokens starting with exactly this header were issued by this service and
+# can be verified without PyJWT; anything else falls back to jwt.decode
+_FAST_DECODE_PREFIX = (_HEADER_B64 + b".").decode("ascii") if (
+    _DIGEST is not None and settings.JWT_FAST_PATH
+) else None
 
-def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
+# Decoded payloads of recently validated tokens, keyed by a hash of the token.
+# TTLCache is not thread-safe and decode_token also runs from sync endpoints
+# in the threadpool, so access goes through a lock.
+token_cache: TTLCache = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL)
+token_cache_lock = threading.Lock()
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token payloads, forcing full validation on next use."""
+    with token_cache_lock:
+        token_cache.clear()
+
+
+def _b64encode(data: bytes) -> bytes:
+    """Base64url-encode without padding, as used in JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _encode_hmac(claims: Dict[str, Any]) -> str:
     """
-    Create a new JWT access token.
+    Sign claims as an HS* JWT without going through PyJWT.
+    
+    Args:
+        claims: JSON-serializable token claims
+        
+    Returns:
+        Compact JWT string, equivalent to ``jwt.encode`` for the same claims
+    """
+    signing_input = _HEADER_B64 + b"." + _b64encode(orjson.dumps(claims))
+    signature = hmac.new(_SECRET, signing_input, _DIGEST).digest()
+    return (signing_input + b"." + _b64encode(signature)).decode("ascii")
+
+
+def _int_claim(payload: Dict[str, Any], claim: str, error: type, message: str) -> int:
+    """Read a numeric claim the way PyJWT does, raising ``error`` if it is not one."""
+    try:
+        return int(payload[claim])
+    except (ValueError, TypeError, OverflowError):
+        raise error(message) from None
+
+
+def _decode_hmac(token: str) -> Dict[str, Any]:
+    """
+    Verify and decode an HS* JWT carrying this service's header.
+    
+    Mirrors ``jwt.decode`` with ``_DECODE_OPTIONS`` and no audience or
+    issuer: the same claims are checked in the same order and raise the
+    same exception types.
+    
+    Args:
+        token: JWT token whose header segment is ``_HEADER_B64``
+        
+    Returns:
+        Dict containing decoded token payload
+        
+    Raises:
+        InvalidTokenError: If the signature, payload or claims are invalid
+    """
+    try:
+        signing_input, _, signature = token.encode("ascii").rpartition(b".")
+    except UnicodeEncodeError:
+        raise DecodeError("Invalid token encoding") from None
+    
+    expected = _b64encode(hmac.new(_SECRET, signing_input, _DIGEST).digest())
+    if not hmac.compare_digest(expected, signature):
+        raise InvalidSignatureError("Signature verification failed")
+    
+    payload_b64 = signing_input.partition(b".")[2]
+    try:
+        payload = orjson.loads(
+            base64.urlsafe_b64decode(payload_b64 + b"=" * (-len(payload_b64) % 4))
+        )
+    except (ValueError, orjson.JSONDecodeError):
+        raise DecodeError("Invalid payload") from None
+    if not isinstance(payload, dict):
+        raise DecodeError("Invalid payload")
+    
+    for claim in _DECODE_OPTIONS["require"]:
+        if payload.get(claim) is None:
+            raise MissingRequiredClaimError(claim)
+    
+    now = time.time()
+    if "iat" in payload:
+        iat = _int_claim(
+            payload,
+            "iat",
+            InvalidIssuedAtError,
+            "Issued At claim (iat) must be an integer.",
+        )
+        if iat > now:
+            raise ImmatureSignatureError("The token is not yet valid (iat)")
+    if "nbf" in payload:
+        nbf = _int_claim(
+            payload, "nbf", DecodeError, "Not Before claim (nbf) must be an integer."
+        )
+        if nbf > now:
+            raise ImmatureSignatureError("The token is not yet valid (nbf)")
+    exp = _int_claim(
+        payload, "exp", DecodeError, "Expiration Time claim (exp) must be an integer."
+    )
+    if exp <= now:
+        raise ExpiredSignatureError("Signature has expired")
+    if payload.get("aud"):
+        # No audience is expected, so any non-empty aud claim is rejected
+        raise InvalidAudienceError("Invalid audience")
+    if not isinstance(payload["sub"], str):
+        raise InvalidSubjectError("Subject must be a string")
+    if "jti" in payload and not isinstance(payload["jti"], str):
+        raise InvalidJTIError("JWT ID must be a string")
+    
+    return payload
+
+
+def create_access_token_with_exp(
+    subject: str, expires_delta: Optional[timedelta] = None
+) -> Tuple[str, int]:
+    """
+    Create a new JWT access token and report its expiration.
     
     Args:
         subject: Token subject (typically user ID)
         expires_delta: Optional custom expiration time
         
     Returns:
-        JWT token string
+        Tuple of the JWT token string and its ``exp`` claim as a Unix timestamp
     """
+    # Work in integer Unix seconds; PyJWT accepts them directly for exp/iat
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        expire = now + int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = now + _DEFAULT_EXPIRE_SECONDS
     
-    to_encode = {"sub": subject, "exp": expire, "iat": datetime.utcnow()}
+    to_encode = {"sub": subject, "exp": expire, "iat": now}
     
     try:
-        encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-        logger.debug(f"Created JWT token for user {subject}")
-        return encoded_jwt
+        if _DIGEST is not None:
+            encoded_jwt = _encode_hmac(to_encode)
+        else:
+            encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=_ALG)
+        logger.debug("Created JWT token for user %s", subject)
+        return encoded_jwt, expire
     except Exception as e:
-        logger.error(f"Error creating JWT token: {str(e)}")
+        logger.error("Error creating JWT token: %s", e)
         raise
 
 
+def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
+    """
+    Create a new JWT access token.
+    
+    Args:
+        subject: Token subject (typically user ID)
+        expires_delta: Optional custom expiration time
+        
+    Returns:
+        JWT token string
+    """
+    return create_access_token_with_exp(subject, expires_delta)[0]
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """
     Decode and validate a JWT token.
@@ -64,26 +244,40 @@ def decode_token(token: str) -> Dict[str, Any]:
     Raises:
         HTTPException: If token is invalid or expired
     """
-    try:
-        # Decode the JWT token
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
+    # Reject anything that is not header.payload.signature before doing crypto
+    if token.count(".") != 2:
+        logger.warning("Malformed token")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
         )
-        
-        # Parse token data
-        token_data = TokenPayload(**payload)
-        
-        # Check if token has expired
-        if datetime.fromtimestamp(token_data.exp) < datetime.utcnow():
-            logger.warning(f"Expired token attempt for user {token_data.sub}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token expired",
-                headers={"WWW-Authenticate": "Bearer"},
+    
+    # Reuse a recent successful decode of the same token; the raw token is
+    # never stored and an entry is ignored once the token itself has expired
+    cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    with token_cache_lock:
+        cached_payload = token_cache.get(cache_key)
+    if cached_payload is not None and cached_payload["exp"] > time.time():
+        return cached_payload
+    
+    try:
+        # Decode the JWT token; both paths enforce the required claims and
+        # reject expired tokens with ExpiredSignatureError
+        if _FAST_DECODE_PREFIX is not None and token.startswith(_FAST_DECODE_PREFIX):
+            payload = _decode_hmac(token)
+        else:
+            payload = jwt.decode(
+                token,
+                _SECRET,
+                algorithms=_ALGS,
+                options=_DECODE_OPTIONS,
             )
         
+        # Only successful decodes are cached; invalid tokens always take the
+        # full path
+        with token_cache_lock:
+            token_cache[cache_key] = payload
         return payload
     
     except ExpiredSignatureError:
@@ -94,14 +288,14 @@ def decode_token(token: str) -> Dict[str, Any]:
             headers={"WWW-Authenticate": "Bearer"},
         )
     except InvalidTokenError as e:
-        logger.warning(f"Invalid token: {str(e)}")
+        logger.warning("Invalid token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     except Exception as e:
-        logger.error(f"Error decoding token: {str(e)}")
+        logger.error("Error decoding token: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication error",
@@ -121,31 +315,33 @@ def get_token_from_request(request: Request) -> Optional[str]:
     """
     # Try to get token from cookie first
     token = request.cookies.get(JWT_TOKEN_COOKIE_NAME)
+    if token:
+        return token
     
-    # If not in cookie, try Authorization header
-    if not token and 'Authorization' in request.headers:
-        auth_header = request.headers.get('Authorization')
-        if auth_header and auth_header.startswith('Bearer '):
-            token = auth_header.replace('Bearer ', '')
+    # If not in cookie, try Authorization header (scheme is case-insensitive)
+    auth_header = request.headers.get('Authorization', '')
+    if auth_header[:7].lower() == 'bearer ':
+        return auth_header[7:]
     
-    return token
+    return None
 
 
-async def get_current_user_optional(request: Request = None, token: str = Depends(oauth2_scheme)) -> Optional[Dict[str, Any]]:
+async def get_current_user_optional(request: Request) -> Optional[Dict[str, Any]]:
     """
     Get current user from token (if provided).
     
     Args:
         request: FastAPI request
-        token: JWT token from Authorization header (via Depends)
         
     Returns:
         Dict containing user information or None if no token
     """
-    # Try to get token from request if not provided via Depends
-    if not token and request:
-        token = get_token_from_request(request)
+    # AppMiddleware has already validated the token for this request
+    payload = jwt_payload_var.get()
+    if payload is not None:
+        return {"user_id": payload["sub"]}
     
+    token = get_token_from_request(request)
     if not token:
         return None
     
@@ -156,13 +352,12 @@ async def get_current_user_optional(request: Request = None, token: str = Depend
         return None
 
 
-async def get_current_user(request: Request = None, token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
+async def get_current_user(request: Request) -> Dict[str, Any]:
     """
     Get current user from token (required).
     
     Args:
         request: FastAPI request
-        token: JWT token from Authorization header (via Depends)
         
     Returns:
         Dict containing user information
@@ -170,10 +365,12 @@ async def get_current_user(request: Request = None, token: str = Depends(oauth2_
     Raises:
         HTTPException: If no token or token is invalid
     """
-    # Try to get token from request if not provided via Depends
-    if not token and request:
-        token = get_token_from_request(request)
+    # AppMiddleware has already validated the token for this request
+    payload = jwt_payload_var.get()
+    if payload is not None:
+        return {"user_id": payload["sub"]}
     
+    token = get_token_from_request(request)
     if not token:
         logger.warning("Authentication attempt without token")
         raise HTTPException(
@@ -184,13 +381,13 @@ async def get_current_user(request: Request = None, token: str = Depends(oauth2_
     
     try:
         payload = decode_token(token)
-        logger.debug(f"Successfully authenticated user {payload['sub']}")
+        logger.debug("Successfully authenticated user %s", payload["sub"])
         return {"user_id": payload["sub"]}
     except HTTPException as e:
         # Re-raise the exception from decode_token
         raise e
     except Exception as e:
-        logger.error(f"Unexpected error in authentication: {str(e)}")
+        logger.error("Unexpected error in authentication: %s", e)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authentication error",
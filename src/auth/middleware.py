@@ -1,115 +1,113 @@
 """
-Authentication middleware for handling JWT token validation.
+Authentication helpers for the application middleware.
 
-This middleware extracts JWT tokens from requests and attaches
-user information to the request state for easier access.
+These functions extract and validate JWT tokens from requests, decide
+when a token should be refreshed, and build the cookie used to
+auto-refresh expiring tokens.
 """
 
 import logging
-from typing import Optional
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.requests import Request
+from starlette.types import Scope
 
-from src.auth.jwt import get_token_from_request, decode_token
-from src.config.constants import JWT_TOKEN_COOKIE_NAME
+from src.auth.jwt import create_access_token, get_token_from_request, decode_token
+from src.config import get_settings
+from src.config.constants import API_V1_STR, JWT_TOKEN_COOKIE_NAME
 
+settings = get_settings()
 logger = logging.getLogger("algelab.middleware.auth")
 
+# Path prefixes that never need auth state; str.startswith takes the
+# whole tuple at once
+SKIP_PATHS: Tuple[str, ...] = (
+    "/health",
+    "/api/auth/github",
+    "/api/auth/github/callback",
+    "/swagger",
+    "/redoc",
+    "/docs",
+    "/openapi.json",
+)
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    """
-    Middleware to process JWT tokens and attach user info to request.
+_REFRESH_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+# Set-Cookie value for refreshed tokens, matching the attributes that
+# Response.set_cookie produces. JWTs are base64url segments joined by dots,
+# so the token never needs cookie quoting.
+_COOKIE_TEMPLATE = (
+    f"{JWT_TOKEN_COOKIE_NAME}={{token}}; "
+    f"{'HttpOnly; ' if settings.COOKIE_HTTPONLY else ''}"
+    f"Max-Age={settings.COOKIE_MAX_AGE}; Path=/; "
+    f"SameSite={settings.COOKIE_SAMESITE}"
+    f"{'; Secure' if settings.COOKIE_SECURE else ''}"
+)
+
+
+def authenticate_request(scope: Scope) -> Optional[Dict[str, Any]]:
     """
+    Extract and validate the request's token.
     
-    async def dispatch(self, request: Request, call_next) -> Response:
-        """
-        Process request, extract token, and attach user info.
-        
-        Args:
-            request: The incoming request
-            call_next: The next middleware/endpoint handler
-            
-        Returns:
-            The response from downstream handlers
-        """
-        # Skip auth processing for certain paths
-        path = request.url.path
-        skip_paths = [
-            "/health",
-            "/api/auth/github",
-            "/api/auth/github/callback",
-            "/swagger",
-            "/redoc",
-            "/docs",
-            "/openapi.json",
-        ]
-        
-        if any(path.startswith(skip_path) for skip_path in skip_paths):
-            return await call_next(request)
+    Args:
+        scope: ASGI HTTP connection scope
         
-        # Extract token
-        token = get_token_from_request(request)
-        
-        # Attach user info to request state if token is valid
-        if token:
-            try:
-                payload = decode_token(token)
-                # Set user info in request state for easy access
-                request.state.user = {"user_id": payload["sub"]}
-                request.state.authenticated = True
-                
-                # Check if token will expire soon (within 10 minutes)
-                import time
-                current_time = int(time.time())
-                if payload["exp"] - current_time < 600:  # 10 minutes
-                    request.state.token_expiring_soon = True
-                    logger.debug(f"Token for user {payload['sub']} expiring soon")
-                
-            except Exception as e:
-                # Don't fail the request, just log the issue
-                logger.debug(f"Invalid token: {str(e)}")
-                request.state.user = None
-                request.state.authenticated = False
-        else:
-            request.state.user = None
-            request.state.authenticated = False
-        
-        # Continue processing the request
-        response = await call_next(request)
+    Returns:
+        Decoded token payload, or None if the path does not use auth or
+        the request carries no valid token
+    """
+    # Only API routes consume the auth state; everything else passes through
+    path = scope["path"]
+    if not path.startswith(API_V1_STR) or path.startswith(SKIP_PATHS):
+        return None
+    
+    # Extract token
+    token = get_token_from_request(Request(scope))
+    if not token:
+        return None
+    
+    try:
+        return decode_token(token)
+    except Exception as e:
+        # Don't fail the request, just log the issue
+        logger.debug("Invalid token: %s", e)
+        return None
+
+
+def refresh_subject(payload: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Decide whether a request's token should be auto-refreshed.
+    
+    Args:
+        payload: Decoded token payload, or None if unauthenticated
         
-        # Auto-refresh expiring tokens
-        if (
-            hasattr(request.state, "token_expiring_soon") 
-            and request.state.token_expiring_soon 
-            and request.state.authenticated
-            and response.status_code < 400  # Only refresh on successful responses
-        ):
-            from src.auth.jwt import create_access_token
-            from datetime import timedelta
-            from src.config import get_settings
-            
-            settings = get_settings()
-            
-            # Create new token
-            user_id = request.state.user["user_id"]
-            new_token = create_access_token(
-                subject=user_id,
-                expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-            )
-            
-            # Set refreshed token in response
-            response.set_cookie(
-                key=JWT_TOKEN_COOKIE_NAME,
-                value=new_token,
-                max_age=settings.COOKIE_MAX_AGE,
-                httponly=settings.COOKIE_HTTPONLY,
-                secure=settings.COOKIE_SECURE,
-                samesite=settings.COOKIE_SAMESITE,
-                path="/",
-            )
-            
-            logger.debug(f"Auto-refreshed token for user {user_id}")
+    Returns:
+        ID of the user whose token expires within 10 minutes, otherwise None
+    """
+    if payload is None or payload["exp"] - time.time() >= 600:  # 10 minutes
+        return None
+    
+    logger.debug("Token for user %s expiring soon", payload["sub"])
+    return payload["sub"]
+
+
+def refresh_cookie_header(user_id: str) -> Tuple[bytes, bytes]:
+    """
+    Build a Set-Cookie header carrying a freshly issued token.
+    
+    Args:
+        user_id: ID of the user to issue the token for
         
-        return response
\ No newline at end of file
+    Returns:
+        Raw ``(name, value)`` header pair
+    """
+    # Create new token
+    new_token = create_access_token(
+        subject=user_id,
+        expires_delta=_REFRESH_DELTA
+    )
+    
+    logger.debug("Auto-refreshed token for user %s", user_id)
+    return (b"set-cookie", _COOKIE_TEMPLATE.format(token=new_token).encode("latin-1"))
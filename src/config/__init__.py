@@ -6,18 +6,16 @@ a centralized way to access configuration throughout the application.
 """
 
 import os
-from functools import lru_cache
 
+from src.config.base import Settings
 from src.config.dev import DevSettings
 from src.config.prod import ProdSettings
 from src.exceptions import ConfigurationError
 
 
-
-@lru_cache()
-def get_settings():
+def _load_settings() -> Settings:
     """
-    Get settings based on environment.
+    Load settings based on environment.
     
     Uses environment variable 'ENVIRONMENT' to determine which settings to load.
     Defaults to development settings if not specified.
@@ -35,4 +33,21 @@ def get_settings():
     elif env == "development":
         return DevSettings()
     else:
-        raise ConfigurationError(f"Unknown environment: {env}")
\ No newline at end of file
+        raise ConfigurationError(f"Unknown environment: {env}")
+
+
+# Settings are fixed for the process lifetime, so they are built once at import
+SETTINGS = _load_settings()
+
+
+def get_settings() -> Settings:
+    """
+    Get the application settings.
+    
+    This is the public accessor used by modules that need configuration;
+    it returns the instance built once at import.
+    
+    Returns:
+        Settings object with the appropriate configuration
+    """
+    return SETTINGS
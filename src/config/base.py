@@ -18,6 +18,9 @@ class Settings(BaseSettings):
     PROJECT_DESCRIPTION: str = "An open-source web platform for linear algebra learning"
     VERSION: str = "1.0.0"
     
+    # Environment name, matching the ENVIRONMENT variable that selects the settings class
+    ENVIRONMENT: str = "development"
+    
     # Debugging
     DEBUG: bool = False
     SHOW_SWAGGER: bool = Field(..., description="Show Swagger UI for API documentation")
@@ -28,6 +31,7 @@ class Settings(BaseSettings):
     # Security
     SECRET_KEY: str = Field(..., description="Used for JWT token signing and other security features")
     ALGORITHM: str = "HS256"
+    JWT_FAST_PATH: bool = True  # verify our own HS* tokens without PyJWT
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1400 # 24 hours / change to when finding the right time
     RESET_TOKEN_EXPIRE_MINUTES: int = 1400 # 24 hours / change to when finding the right time
     
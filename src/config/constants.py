@@ -21,11 +21,17 @@ API_V1_STR = "/api"
 # JWT related
 JWT_TOKEN_COOKIE_NAME = "jwt_token"
 JWT_REFRESH_COOKIE_NAME = "refresh_token"
+TOKEN_CACHE_MAXSIZE = 10000
+TOKEN_CACHE_TTL = 5  # seconds; bounds how long a decoded token is trusted
+USER_CACHE_MAXSIZE = 5000
+USER_CACHE_TTL = 30  # seconds
 
 # GitHub auth
 GITHUB_API_URL = "https://api.github.com"
 GITHUB_AUTH_URL = "https://github.com/login/oauth/authorize"
 GITHUB_TOKEN_URL = "https://github.com/login/oauth/access_token"
+GITHUB_REQUEST_TIMEOUT = 10  # seconds
+GITHUB_AVATAR_URL = "https://github.com/{}.png"
 
 # Other constants
 DEFAULT_PAGE_SIZE = 20
@@ -6,22 +6,66 @@ environment-specific settings.
 """
 
 import os
+import queue
 import logging
 import logging.handlers
 from pathlib import Path
+from typing import List, Tuple
 
 from src.config import get_settings
 from src.config.constants import BASE_DIR
 
 settings = get_settings()
 
+# Listeners that own the file/console handlers on a background thread,
+# with the logger and QueueHandler that feed each one
+_listeners: List[
+    Tuple[logging.Logger, logging.handlers.QueueHandler, logging.handlers.QueueListener]
+] = []
+
+
+def _start_listener(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """
+    Run handlers on a background thread fed by an in-memory queue.
+    
+    Args:
+        logger: Logger that gets a QueueHandler in place of the handlers
+        handlers: Handlers that perform the actual (blocking) output
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    listener.start()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    _listeners.append((logger, queue_handler, listener))
+
+
+def stop_logging() -> None:
+    """
+    Stop the background log listeners, flushing any queued records.
+    
+    The queue handlers are detached so later records are not queued
+    with nothing to read them, and the wrapped handlers are closed to
+    release their files.
+    """
+    while _listeners:
+        logger, queue_handler, listener = _listeners.pop()
+        listener.stop()
+        logger.removeHandler(queue_handler)
+        queue_handler.close()
+        for handler in listener.handlers:
+            handler.close()
+
 
 def configure_logging():
     """
     Configure logging settings for the application.
     
     - Creates log directory if it doesn't exist
-    - Sets up file and console handlers
+    - Sets up file and console handlers behind a queue, so logging
+      calls never block on I/O
     - Configures log levels based on settings
     - Sets up format and handlers for different loggers
     """
@@ -37,8 +81,9 @@ def configure_logging():
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear existing handlers
-    for handler in root_logger.handlers:
+    # Clear existing handlers and listeners from a previous configuration
+    stop_logging()
+    for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
     # Create formatters
@@ -62,8 +107,7 @@ def configure_logging():
     console_handler.setFormatter(standard_formatter)
     
     # Add handlers to root logger
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    _start_listener(root_logger, file_handler, console_handler)
     
     # Set log levels for third-party libraries
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -71,6 +115,8 @@ def configure_logging():
     
     # Security logger (for auth and security events)
     security_logger = logging.getLogger("algelab.security")
+    for handler in security_logger.handlers[:]:
+        security_logger.removeHandler(handler)
     security_log_file = os.path.join(log_dir, "security.log")
     
     security_handler = logging.handlers.RotatingFileHandler(
@@ -80,7 +126,7 @@ def configure_logging():
         encoding="utf-8",
     )
     security_handler.setFormatter(standard_formatter)
-    security_logger.addHandler(security_handler)
+    _start_listener(security_logger, security_handler)
     security_logger.setLevel(logging.INFO)
     
     return {
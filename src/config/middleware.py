@@ -7,8 +7,7 @@ and other application-wide concerns.
 
 import time
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -16,10 +15,10 @@ from fastapi.middleware.gzip import GZipMiddleware
 
 from src.config import get_settings
 from src.config.logging import configure_logging
-from src.auth.middleware import AuthMiddleware
+from src.auth.context import jwt_payload_var
+from src.auth.middleware import authenticate_request, refresh_cookie_header, refresh_subject
 
 settings = get_settings()
-
 loggers = configure_logging()
 logger = logging.getLogger("algelab.middleware")
 
@@ -40,69 +39,96 @@ def setup_middleware(app: FastAPI):
         allow_headers=settings.CORS_ALLOW_HEADERS,
     )
     
-    # Add authentication middleware
-    app.add_middleware(AuthMiddleware)
-    # Add request logging middleware
-    app.add_middleware(RequestLoggingMiddleware)
+    # Add authentication, request logging and security headers middleware
+    app.add_middleware(AppMiddleware)
     
-    # Add security headers middleware in production
-    if not settings.DEBUG:
-        app.add_middleware(SecurityHeadersMiddleware)
-        
-        # Add trusted host middleware in production
-        if hasattr(settings, 'TRUSTED_HOSTS'):
-            app.add_middleware(
-                TrustedHostMiddleware, 
-                allowed_hosts=settings.TRUSTED_HOSTS
-            )
+    # Add trusted host middleware in production
+    if not settings.DEBUG and hasattr(settings, 'TRUSTED_HOSTS'):
+        app.add_middleware(
+            TrustedHostMiddleware, 
+            allowed_hosts=settings.TRUSTED_HOSTS
+        )
     
     # Add gzip compression
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging request information and timing."""
+class AppMiddleware:
+    """
+    Single pure ASGI middleware for auth state, request logging and
+    security headers.
+    
+    Folding the three concerns into one layer means one ``send`` wrapper
+    and one pass over the response headers per request.
+    """
     
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        path = request.url.path
+    # Health checks are too frequent to be worth logging
+    UNLOGGED_PATHS = frozenset({"/health", "/api/health"})
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # Security headers only apply in production, pre-encoded by the settings
+        self.security_headers = (
+            () if settings.DEBUG else getattr(settings, "security_headers_raw", ())
+        )
+        self.security_header_names = {name for name, _ in self.security_headers}
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Skip logging for health check endpoints
-        if path == "/health" or path == "/api/health":
-            return await call_next(request)
+        start_time = time.perf_counter()
+        path = scope["path"]
+        method = scope["method"]
+        log_request = path not in self.UNLOGGED_PATHS
+        payload = authenticate_request(scope)
+        refresh_user_id = refresh_subject(payload)
+        status_code = 500
         
-        # Process the request
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                
+                # Security headers from settings replace any set downstream
+                if self.security_headers:
+                    headers = [
+                        header for header in headers
+                        if header[0].lower() not in self.security_header_names
+                    ]
+                    headers.extend(self.security_headers)
+                
+                # Add timing header to response
+                if log_request:
+                    process_time = time.perf_counter() - start_time
+                    headers.append((b"x-process-time", str(process_time).encode("latin-1")))
+                
+                # Auto-refresh expiring tokens on successful responses
+                if refresh_user_id is not None and status_code < 400:
+                    headers.append(refresh_cookie_header(refresh_user_id))
+                
+                message["headers"] = headers
+            await send(message)
+        
+        # Process the request with the token payload in the auth context
+        context_token = jwt_payload_var.set(payload)
         try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            status_code = response.status_code
-            
-            # Log request details
-            logger.info(
-                f"{request.method} {path} {status_code} {process_time:.4f}s"
-            )
-            
-            # Add timing header to response
-            response.headers["X-Process-Time"] = str(process_time)
-            return response
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            process_time = time.time() - start_time
-            logger.exception(
-                f"Error during {request.method} {path}: {str(e)} {process_time:.4f}s"
-            )
+            if log_request:
+                process_time = time.perf_counter() - start_time
+                logger.exception(
+                    "Error during %s %s: %s %.4fs", method, path, e, process_time
+                )
             raise
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware for adding security headers to responses."""
-    
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-        
-        # Add security headers from settings
-        if hasattr(settings, 'SECURITY_HEADERS'):
-            for header_name, header_value in settings.SECURITY_HEADERS.items():
-                response.headers[header_name] = header_value
+        finally:
+            jwt_payload_var.reset(context_token)
         
-        return response
\ No newline at end of file
+        if log_request:
+            process_time = time.perf_counter() - start_time
+            
+            # Log request details
+            logger.info("%s %s %d %.4fs", method, path, status_code, process_time)
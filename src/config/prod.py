@@ -6,9 +6,11 @@ These settings override the base settings when running in production mode.
 """
 
 import os
-from typing import List, Dict
+from functools import cached_property
+from typing import Any, List, Dict, Tuple
 
-from pydantic import Field, field_validator
+import orjson
+from pydantic import Field, model_validator
 
 from src.config.base import Settings
 from src.config.constants import BASE_DIR
@@ -21,6 +23,9 @@ class ProdSettings(Settings):
     Inherits from base Settings and overrides values
     suitable for production deployment.
     """
+    # Environment
+    ENVIRONMENT: str = Field("production", description="Deployment environment name")
+    
     # Disable debug mode
     DEBUG: bool = Field(False, description="Debug mode is always disabled in production")
     
@@ -68,34 +73,41 @@ class ProdSettings(Settings):
         description="List of hosts allowed to access the API"
     )
     
-    # CORS Origins validator to support comma-separated string from env vars
-    @field_validator('CORS_ALLOWED_ORIGINS',mode="before")
-    def parse_cors_origins(cls, v):
-        """Parse CORS origins from string to list if needed."""
-        if isinstance(v, str):
-            return [origin.strip() for origin in v.split(',')]
-        return v
+    # Env vars arrive as strings: comma-separated lists and a JSON object
+    @model_validator(mode="before")
+    @classmethod
+    def parse_env_values(cls, values: Any) -> Any:
+        """Parse list and dict settings given as strings in a single pass."""
+        if not isinstance(values, dict):
+            return values
         
-    # Trusted hosts validator to support comma-separated string from env vars
-    @field_validator('TRUSTED_HOSTS', mode="before")
-    def parse_trusted_hosts(cls, v):
-        """Parse trusted hosts from string to list if needed."""
-        if isinstance(v, str):
-            return [host.strip() for host in v.split(',')]
-        return v
-    
-    # Security headers validator to support JSON string from env vars
-    @field_validator('SECURITY_HEADERS', mode="before")
-    def parse_security_headers(cls, v):
-        """Parse security headers from string to dict if needed."""
-        if isinstance(v, str):
-            import json
+        for key in ("CORS_ALLOWED_ORIGINS", "TRUSTED_HOSTS"):
+            value = values.get(key)
+            if isinstance(value, str):
+                values[key] = [item.strip() for item in value.split(',')]
+        
+        security_headers = values.get("SECURITY_HEADERS")
+        if isinstance(security_headers, str):
             try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                # Return default if parsing fails
-                return cls.__fields__['SECURITY_HEADERS'].default
-        return v
+                values["SECURITY_HEADERS"] = orjson.loads(security_headers)
+            except orjson.JSONDecodeError:
+                # Fall back to the default headers if parsing fails
+                values.pop("SECURITY_HEADERS")
+        
+        return values
+    
+    @cached_property
+    def security_headers_raw(self) -> Tuple[Tuple[bytes, bytes], ...]:
+        """
+        Security headers encoded once as raw ASGI header pairs.
+        
+        Returns:
+            Tuple of lowercase ``(name, value)`` byte pairs
+        """
+        return tuple(
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in self.SECURITY_HEADERS.items()
+        )
     
     # Load environment variables from production file
     class Config:
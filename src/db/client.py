@@ -1,59 +1,78 @@
 """
 Supabase client for database operations.
 
-This module provides a singleton Supabase client for database operations
+This module provides a shared Supabase client for database operations
 and utility functions for database interactions.
 """
 
 import os
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 import logging
-from supabase import create_client, Client
-from functools import lru_cache
+from cachetools import TTLCache
 
 from src.config import get_settings
+from src.config.constants import USER_CACHE_MAXSIZE, USER_CACHE_TTL
+from src.db.exceptions import SupabaseClientError
 
-logger = logging.getLogger("algelab.db")
-settings = get_settings()
-
+if TYPE_CHECKING:
+    from supabase import AsyncClient
 
-class SupabaseClientError(Exception):
-    """Exception raised for Supabase client errors."""
-    pass
+settings = get_settings()
+logger = logging.getLogger("algelab.db")
 
 
 class SupabaseClient:
-    """Singleton Supabase client for database operations."""
+    """
+    Async Supabase client for database operations.
     
-    _instance: Optional['SupabaseClient'] = None
-    _client: Optional[Client] = None
+    Queries are awaited so database I/O never blocks the event loop.
+    Profile rows are cached by user ID for a short TTL; every write
+    through this client refreshes the cached row. All access happens on
+    the event loop, so the cache needs no lock.
+    """
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(SupabaseClient, cls).__new__(cls)
-            cls._instance._initialize_client()
-        return cls._instance
+    def __init__(self, client: "AsyncClient"):
+        self._client = client
+        self._users_by_id: TTLCache = TTLCache(maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL)
     
-    def _initialize_client(self) -> None:
+    @classmethod
+    async def create(cls) -> 'SupabaseClient':
         """Initialize the Supabase client with settings."""
+        # Imported here so the supabase SDK (gotrue, postgrest, realtime,
+        # storage) is only loaded when a client is actually created
+        from supabase import acreate_client
+        
         try:
-            self._client = create_client(
+            client = await acreate_client(
                 settings.NEXT_PUBLIC_SUPABASE_URL,
                 settings.SUPABASE_SERVICE_ROLE_KEY
             )
             logger.info(f"Initialized Supabase client with URL: {settings.NEXT_PUBLIC_SUPABASE_URL}")
+            return cls(client)
         except Exception as e:
             logger.error(f"Failed to initialize Supabase client: {str(e)}")
             raise SupabaseClientError(f"Failed to initialize Supabase client: {str(e)}")
     
     @property
-    def client(self) -> Client:
+    def client(self) -> "AsyncClient":
         """Get the Supabase client instance."""
-        if self._client is None:
-            self._initialize_client()
         return self._client
     
-    def get_user(self, user_id: str) -> Dict[str, Any]:
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop a cached profile so the next lookup reads it from the database.
+        
+        Args:
+            user_id: The user ID whose profile changed
+        """
+        self._users_by_id.pop(user_id, None)
+    
+    def _cache_user(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a fresh profile row in the cache and return it."""
+        self._users_by_id[user['user_id']] = user
+        return user
+    
+    async def get_user(self, user_id: str) -> Dict[str, Any]:
         """
         Get user by ID from the profiles table.
         
@@ -66,16 +85,20 @@ class SupabaseClient:
         Raises:
             SupabaseClientError: If the operation fails
         """
+        cached = self._users_by_id.get(user_id)
+        if cached is not None:
+            return cached
+        
         try:
-            response = self.client.table('profiles').select('*').eq('user_id', user_id).execute()
+            response = await self.client.table('profiles').select('*').eq('user_id', user_id).execute()
             if response.data:
-                return response.data[0]
+                return self._cache_user(response.data[0])
             return None
         except Exception as e:
             logger.error(f"Error fetching user {user_id}: {str(e)}")
             raise SupabaseClientError(f"Error fetching user: {str(e)}")
     
-    def create_or_update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def create_or_update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Create or update user in the profiles table.
         
@@ -89,54 +112,51 @@ class SupabaseClient:
         Raises:
             SupabaseClientError: If the operation fails
         """
+        # Drop the cached row first so a failed write cannot leave it serving
+        # data the caller just tried to replace
+        self.invalidate_user(user_id)
+        
+        # A single upsert on the primary key replaces the lookup followed by
+        # an insert or update, and cannot race with a concurrent insert
         try:
-            # Check if user exists
-            existing_user = self.get_user(user_id)
-            
-            if existing_user:
-                # Update user
-                response = self.client.table('profiles').update(user_data).eq('user_id', user_id).execute()
-            else:
-                # Create user
-                user_data['user_id'] = user_id
-                response = self.client.table('profiles').insert(user_data).execute()
-            
+            response = await self.client.table('profiles').upsert(
+                {**user_data, 'user_id': user_id},
+                on_conflict='user_id'
+            ).execute()
             if response.data:
-                return response.data[0]
+                return self._cache_user(response.data[0])
             raise SupabaseClientError("Failed to create or update user")
         except Exception as e:
-            logger.error(f"Error creating/updating user {user_id}: {str(e)}")
-            raise SupabaseClientError(f"Error creating/updating user: {str(e)}")
+            logger.error(f"Error creating or updating user {user_id}: {str(e)}")
+            raise SupabaseClientError(f"Error creating or updating user: {str(e)}")
+
+
+_db_client: Optional[SupabaseClient] = None
+
+
+async def init_db_client() -> SupabaseClient:
+    """
+    Create the shared Supabase client; called once from the app lifespan.
     
-    def get_user_by_github_username(self, github_username: str) -> Dict[str, Any]:
-        """
-        Get user by GitHub username.
-        
-        Args:
-            github_username: The GitHub username to look up
-            
-        Returns:
-            Dict containing user profile information or None if not found
-            
-        Raises:
-            SupabaseClientError: If the operation fails
-        """
-        try:
-            response = self.client.table('profiles').select('*').eq('github_username', github_username).execute()
-            if response.data:
-                return response.data[0]
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching user by GitHub username {github_username}: {str(e)}")
-            raise SupabaseClientError(f"Error fetching user by GitHub username: {str(e)}")
+    Returns:
+        Shared SupabaseClient instance
+    """
+    global _db_client
+    if _db_client is None:
+        _db_client = await SupabaseClient.create()
+    return _db_client
 
 
-@lru_cache()
 def get_db_client() -> SupabaseClient:
     """
-    Get or create Supabase client instance.
+    Get the shared Supabase client instance.
     
     Returns:
-        Singleton SupabaseClient instance
+        Shared SupabaseClient instance
+        
+    Raises:
+        SupabaseClientError: If the client has not been initialized yet
     """
-    return SupabaseClient()
\ No newline at end of file
+    if _db_client is None:
+        raise SupabaseClientError("Supabase client has not been initialized")
+    return _db_client
@@ -7,15 +7,26 @@ for FastAPI integration.
 """
 
 import logging
-from typing import Dict, Any, Optional, Union, List
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Union, List
 
 from fastapi import HTTPException, status, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from pydantic import ValidationError as PydanticValidationError
 
 logger = logging.getLogger("algelab.exceptions")
 
+# Map standard HTTP errors to error codes
+HTTP_ERROR_CODES: Mapping[int, str] = MappingProxyType({
+    status.HTTP_401_UNAUTHORIZED: "unauthorized",
+    status.HTTP_403_FORBIDDEN: "forbidden",
+    status.HTTP_404_NOT_FOUND: "not_found",
+    status.HTTP_405_METHOD_NOT_ALLOWED: "method_not_allowed",
+    status.HTTP_422_UNPROCESSABLE_ENTITY: "validation_error",
+    status.HTTP_429_TOO_MANY_REQUESTS: "rate_limit_exceeded",
+})
+
 
 class AlgelabException(Exception):
     """Base exception class for all AlgeLab specific exceptions."""
@@ -91,7 +102,7 @@ class ConflictError(AlgelabException):
 
 # Exception Handlers for FastAPI
 
-async def algelab_exception_handler(request: Request, exc: AlgelabException) -> JSONResponse:
+async def algelab_exception_handler(request: Request, exc: AlgelabException) -> ORJSONResponse:
     """
     Handle AlgeLab exceptions and convert to standardized JSON response.
     
@@ -100,32 +111,29 @@ async def algelab_exception_handler(request: Request, exc: AlgelabException) ->
         exc: AlgeLab exception instance
         
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
     # Log exception based on severity
     if exc.status_code >= 500:
         logger.error(
-            f"Internal error: {exc.detail}",
-            extra={"path": request.url.path, "error_code": exc.error_code}
+            "Internal error on %s (%s): %s", request.scope["path"], exc.error_code, exc.detail
         )
-    elif exc.status_code >= 400:
+    elif exc.status_code >= 400 and logger.isEnabledFor(logging.WARNING):
         logger.warning(
-            f"Client error: {exc.detail}",
-            extra={"path": request.url.path, "error_code": exc.error_code}
+            "Client error on %s (%s): %s", request.scope["path"], exc.error_code, exc.detail
         )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.error_code,
-            "detail": exc.detail,
-            "status_code": exc.status_code
+            "detail": exc.detail
         },
         headers=exc.headers
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """
     Handle FastAPI HTTPExceptions.
     
@@ -134,43 +142,26 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
         exc: HTTPException instance
         
     Returns:
-        JSONResponse with error details
+        ORJSONResponse with error details
     """
-    # Map standard HTTP errors to error codes
-    error_code_map = {
-        status.HTTP_401_UNAUTHORIZED: "unauthorized",
-        status.HTTP_403_FORBIDDEN: "forbidden",
-        status.HTTP_404_NOT_FOUND: "not_found",
-        status.HTTP_405_METHOD_NOT_ALLOWED: "method_not_allowed",
-        status.HTTP_422_UNPROCESSABLE_ENTITY: "validation_error",
-        status.HTTP_429_TOO_MANY_REQUESTS: "rate_limit_exceeded",
-    }
-    
-    error_code = error_code_map.get(exc.status_code, f"http_{exc.status_code}")
+    error_code = HTTP_ERROR_CODES.get(exc.status_code) or f"http_{exc.status_code}"
     
     if exc.status_code >= 500:
-        logger.error(
-            f"HTTP error {exc.status_code}: {exc.detail}",
-            extra={"path": request.url.path}
-        )
-    else:
-        logger.warning(
-            f"HTTP error {exc.status_code}: {exc.detail}",
-            extra={"path": request.url.path}
-        )
+        logger.error("HTTP error %d on %s: %s", exc.status_code, request.scope["path"], exc.detail)
+    elif logger.isEnabledFor(logging.WARNING):
+        logger.warning("HTTP error %d on %s: %s", exc.status_code, request.scope["path"], exc.detail)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": error_code,
-            "detail": exc.detail,
-            "status_code": exc.status_code
+            "detail": exc.detail
         },
         headers=exc.headers
     )
 
 
-async def validation_exception_handler(request: Request, exc: Union[RequestValidationError, PydanticValidationError]) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: Union[RequestValidationError, PydanticValidationError]) -> ORJSONResponse:
     """
     Handle Pydantic and FastAPI validation errors.
     
@@ -179,42 +170,27 @@ async def validation_exception_handler(request: Request, exc: Union[RequestValid
         exc: ValidationError instance
         
     Returns:
-        JSONResponse with validation error details
+        ORJSONResponse with validation error details
     """
-    errors: List[Dict[str, Any]] = []
-    
-    if isinstance(exc, RequestValidationError):
-        validation_errors = exc.errors()
-    else:  # PydanticValidationError
-        validation_errors = exc.errors()
-    
-    for error in validation_errors:
-        # Format error location (field path)
-        loc = error.get('loc', [])
-        if isinstance(loc, tuple):
-            loc = list(loc)
-        
-        field_path = " → ".join(str(item) for item in loc)
-        
-        # Add formatted error
-        errors.append({
-            "field": field_path,
+    # Field paths are dotted, e.g. "body.user.email"
+    errors: List[Dict[str, Any]] = [
+        {
+            "field": ".".join(map(str, error.get('loc', ()))),
             "type": error.get('type', 'unknown'),
             "message": error.get('msg', 'Invalid value')
-        })
+        }
+        for error in exc.errors()
+    ]
     
-    logger.warning(
-        f"Validation error: {len(errors)} validation issues",
-        extra={"path": request.url.path, "validation_errors": errors}
-    )
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning("Validation error: %d issues on %s", len(errors), request.scope["path"])
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "validation_error",
             "detail": "Input validation error",
-            "errors": errors,
-            "status_code": status.HTTP_422_UNPROCESSABLE_ENTITY
+            "errors": errors
         }
     )
 
@@ -226,23 +202,8 @@ def add_exception_handlers(app):
     Args:
         app: FastAPI application instance
     """
+    # Starlette resolves handlers along the MRO, so this covers every subclass
     app.add_exception_handler(AlgelabException, algelab_exception_handler)
     app.add_exception_handler(HTTPException, http_exception_handler)
     app.add_exception_handler(RequestValidationError, validation_exception_handler)
-    app.add_exception_handler(PydanticValidationError, validation_exception_handler)
-    
-    # Register specific exception classes
-    exception_classes = [
-        ConfigurationError,
-        DatabaseError,
-        AuthenticationError,
-        NotFoundError,
-        ValidationError,
-        PermissionDeniedError,
-        RateLimitError,
-        ExternalServiceError,
-        ConflictError
-    ]
-    
-    for exc_class in exception_classes:
-        app.add_exception_handler(exc_class, algelab_exception_handler)
\ No newline at end of file
+    app.add_exception_handler(PydanticValidationError, validation_exception_handler)
\ No newline at end of file
@@ -6,16 +6,19 @@ sets up routes, and handles startup/shutdown events.
 """
 
 import logging
-from fastapi import FastAPI, Depends
+import orjson
+from fastapi import FastAPI, Depends, Response
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 
 from src.config import get_settings
 from src.config.middleware import setup_middleware
-from src.config.logging import configure_logging
+from src.config.logging import configure_logging, stop_logging
 from src.config.constants import API_V1_STR
 from src.api.routes import api_router
 from src.exceptions import add_exception_handlers
-from src.db.client import get_db_client
+from src.db.client import init_db_client
+from src.auth.github import get_github_client, close_github_client
 
 # Load settings based on environment
 settings = get_settings()
@@ -24,19 +27,36 @@ settings = get_settings()
 loggers = configure_logging()
 logger = logging.getLogger("algelab.main")
 
+# Bodies of the static informational endpoints; they never change at runtime
+HEALTH_BODY = orjson.dumps({
+    "status": "healthy",
+    "name": settings.PROJECT_NAME,
+    "version": settings.VERSION,
+    "environment": settings.ENVIRONMENT,
+})
+ROOT_BODY = orjson.dumps({
+    "name": settings.PROJECT_NAME,
+    "version": settings.VERSION,
+    "description": settings.PROJECT_DESCRIPTION,
+    "environment": settings.ENVIRONMENT,
+    "docs": "/swagger" if settings.SHOW_SWAGGER else None,
+})
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup logic
-    env_type = settings.model_config["env_file"].split(".")[-1]
-    logger.info(f"Starting AlgeLab API in {env_type} mode")
-    db_client = get_db_client()
+    logger.info(f"Starting AlgeLab API in {settings.ENVIRONMENT} mode")
+    await init_db_client()
+    get_github_client()
     logger.info(f"{settings.PROJECT_NAME} API started successfully")
     
     yield
     
     # Shutdown logic
+    await close_github_client()
     logger.info(f"{settings.PROJECT_NAME} API shutting down")
+    stop_logging()
 
 
 # Create FastAPI app
@@ -46,6 +66,8 @@ app = FastAPI(
     version=settings.VERSION,
     docs_url="/swagger" if settings.SHOW_SWAGGER else None,
     redoc_url="/redoc" if settings.SHOW_SWAGGER else None,
+    openapi_url="/openapi.json" if settings.SHOW_SWAGGER else None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
@@ -63,31 +85,20 @@ app.include_router(api_router, prefix=API_V1_STR)
 @app.get("/health", tags=["health"])
 async def health_check():
     """Health check endpoint to verify API is running."""
-    return {
-        "status": "healthy",
-        "name": settings.PROJECT_NAME,
-        "version": settings.VERSION,
-        "environment": settings.model_config["env_file"].split(".")[-1]
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 # Root endpoint
 @app.get("/", tags=["root"])
 async def root():
     """Root endpoint returning basic API information."""
-    return {
-        "name": settings.PROJECT_NAME,
-        "version": settings.VERSION,
-        "description": settings.PROJECT_DESCRIPTION,
-        "environment": settings.model_config["env_file"].split(".")[-1],
-        "docs": "/swagger" if settings.SHOW_SWAGGER else None,
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
     
-    logger.info(f"Starting AlgeLab API in {settings.model_config['env_file'].split('.')[-1]} mode")
+    logger.info(f"Starting AlgeLab API in {settings.ENVIRONMENT} mode")
     
     uvicorn.run(
         "src.main:app",
@@ -7,21 +7,32 @@ for request/response validation and database interactions.
 
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field, EmailStr, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, EmailStr
+
+from src.config.constants import GITHUB_AVATAR_URL
+
+# Response and token models are never mutated after construction
+READ_ONLY_CONFIG = ConfigDict(frozen=True)
 
 
 class TokenPayload(BaseModel):
     """Payload data stored in JWT token."""
+    model_config = READ_ONLY_CONFIG
+    
     sub: str = Field(..., description="Subject (user ID)")
     exp: int = Field(..., description="Expiration timestamp")
     
 class TokenResponse(BaseModel):
     """Token information response."""
+    model_config = READ_ONLY_CONFIG
+    
     user_id: str
     expires_at: int
     
 class Token(BaseModel):
     """Token response model."""
+    model_config = READ_ONLY_CONFIG
+    
     access_token: str
     token_type: str = "bearer"
 
@@ -29,14 +40,15 @@ class Token(BaseModel):
 class UserBase(BaseModel):
     """Base user information shared across requests."""
     username: str
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     first_name: Optional[str] = None
     last_name: Optional[str] = None
 
 
 class UserCreate(UserBase):
     """User information required for creation."""
-    pass
+    # Client input is the one place the email format needs checking
+    email: Optional[EmailStr] = None
 
 
 class ProfileBase(BaseModel):
@@ -57,6 +69,8 @@ class ProfileUpdate(ProfileBase):
 
 class Profile(ProfileBase):
     """Complete profile information returned to clients."""
+    model_config = ConfigDict(from_attributes=True)
+    
     user_id: str
     created_at: datetime
     updated_at: Optional[datetime] = None
@@ -65,45 +79,45 @@ class Profile(ProfileBase):
     def avatar_url(self) -> Optional[str]:
         """Generate GitHub avatar URL from username."""
         if self.github_username:
-            return f"https://github.com/{self.github_username}.png"
+            return GITHUB_AVATAR_URL.format(self.github_username)
         return None
-    
-    class Config:
-        """Pydantic model configuration."""
-        orm_mode = True
 
 
 class User(UserBase):
     """Complete user information returned to clients."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: str
     is_active: bool = True
     profile: Optional[Profile] = None
-    
-    class Config:
-        """Pydantic model configuration."""
-        orm_mode = True
 
 
 class UserInfo(BaseModel):
     """User information returned to the client."""
+    model_config = READ_ONLY_CONFIG
+    
     user_id: str
     username: str
     first_name: Optional[str] = None
     last_name: Optional[str] = None
-    avatar_url: Optional[HttpUrl] = None
+    avatar_url: Optional[str] = None
 
 
 class GitHubUser(BaseModel):
     """GitHub user information from the GitHub API."""
+    model_config = READ_ONLY_CONFIG
+    
     login: str
     id: int
-    avatar_url: Optional[HttpUrl] = None
+    avatar_url: Optional[str] = None
     name: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
 
 
 class GitHubOAuthResponse(BaseModel):
     """GitHub OAuth token response."""
+    model_config = READ_ONLY_CONFIG
+    
     access_token: str
     token_type: str
     scope: Optional[str] = None
@@ -111,6 +125,7 @@ class GitHubOAuthResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Standard error response model."""
+    model_config = READ_ONLY_CONFIG
+    
     error: str
-    detail: Optional[str] = None
-    status_code: int = 400
\ No newline at end of file
+    detail: Optional[str] = None
\ No newline at end of file
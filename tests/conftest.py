@@ -0,0 +1,19 @@
+"""
+Shared test configuration.
+
+Settings are loaded when ``src.config`` is first imported, so the
+environment they need is provided here before any test module imports
+application code.
+"""
+
+import os
+import tempfile
+
+_KEY_FILE = tempfile.NamedTemporaryFile(suffix=".pem", delete=False)
+_KEY_FILE.close()
+
+os.environ.setdefault("ENVIRONMENT", "development")
+os.environ.setdefault("SHOW_SWAGGER", "false")
+os.environ.setdefault("SECRET_KEY", "test-secret-key-with-at-least-32-bytes")
+os.environ.setdefault("SUPABASE_URL", "http://localhost:54321")
+os.environ.setdefault("GITHUB_PRIVATE_KEY_PATH", _KEY_FILE.name)
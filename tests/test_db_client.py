@@ -0,0 +1,80 @@
+"""
+Tests for the profile cache in src.db.client.
+
+The Supabase client is replaced by a small in-memory stand-in that
+implements the query-builder calls SupabaseClient makes.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.db.client import SupabaseClient
+from src.db.exceptions import SupabaseClientError
+
+
+class FakeProfilesTable:
+    """In-memory ``profiles`` table supporting select/eq and upsert."""
+
+    def __init__(self):
+        self.rows = {}
+        self.selects = 0
+        self.fail_writes = False
+        self._op = None
+
+    def select(self, _columns):
+        self._op = ("select", None)
+        return self
+
+    def eq(self, _column, value):
+        self._op = (self._op[0], value)
+        return self
+
+    def upsert(self, row, on_conflict):
+        assert on_conflict == "user_id"
+        self._op = ("upsert", row)
+        return self
+
+    async def execute(self):
+        op, arg = self._op
+        if op == "select":
+            self.selects += 1
+            row = self.rows.get(arg)
+            return SimpleNamespace(data=[dict(row)] if row else [])
+        if self.fail_writes:
+            raise RuntimeError("write failed")
+        row = {**self.rows.get(arg["user_id"], {}), **arg}
+        self.rows[row["user_id"]] = row
+        return SimpleNamespace(data=[dict(row)])
+
+
+@pytest.fixture
+def profiles():
+    return FakeProfilesTable()
+
+
+@pytest.fixture
+def db(profiles):
+    return SupabaseClient(SimpleNamespace(table=lambda _name: profiles))
+
+
+async def test_get_user_reads_after_own_write(db, profiles):
+    profiles.rows["github_1"] = {"user_id": "github_1", "github_username": "old"}
+    assert (await db.get_user("github_1"))["github_username"] == "old"
+
+    await db.create_or_update_user("github_1", {"github_username": "new"})
+
+    assert (await db.get_user("github_1"))["github_username"] == "new"
+    assert profiles.selects == 1
+
+
+async def test_failed_write_drops_cached_user(db, profiles):
+    profiles.rows["github_1"] = {"user_id": "github_1", "github_username": "old"}
+    await db.get_user("github_1")
+    profiles.fail_writes = True
+
+    with pytest.raises(SupabaseClientError):
+        await db.create_or_update_user("github_1", {"github_username": "new"})
+
+    await db.get_user("github_1")
+    assert profiles.selects == 2
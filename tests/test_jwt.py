@@ -0,0 +1,110 @@
+"""
+Tests for JWT handling in src.auth.jwt.
+
+The HMAC fast path must accept and reject exactly the tokens that
+``jwt.decode`` does, so each case runs the same token through both.
+"""
+
+import time
+
+import jwt
+import pytest
+from fastapi import HTTPException
+from jwt.exceptions import InvalidTokenError
+
+from src.auth import jwt as auth_jwt
+
+NOW = int(time.time())
+HOUR = 3600
+LIVE = NOW + HOUR
+
+
+@pytest.fixture(autouse=True)
+def empty_token_cache():
+    """Start every test without payloads cached by an earlier one."""
+    auth_jwt.clear_token_cache()
+    yield
+    auth_jwt.clear_token_cache()
+
+
+def _outcome(decode, token):
+    """Return the decoded payload, or the exception type raised for the token."""
+    try:
+        return decode(token)
+    except InvalidTokenError as e:
+        return type(e)
+
+
+def _pyjwt_decode(token):
+    return jwt.decode(
+        token,
+        auth_jwt._SECRET,
+        algorithms=auth_jwt._ALGS,
+        options=auth_jwt._DECODE_OPTIONS,
+    )
+
+
+@pytest.mark.parametrize(
+    "claims",
+    [
+        pytest.param({"sub": "u1", "exp": LIVE, "iat": NOW}, id="valid"),
+        pytest.param({"sub": "u1", "exp": NOW + HOUR + 0.5}, id="float-exp"),
+        pytest.param({"sub": "u1", "exp": NOW - HOUR + 0.5}, id="float-exp-expired"),
+        pytest.param({"sub": "u1", "exp": str(NOW + HOUR)}, id="numeric-string-exp"),
+        pytest.param({"sub": "u1", "exp": "soon"}, id="bad-exp"),
+        pytest.param({"sub": "u1", "exp": NOW - HOUR}, id="expired"),
+        pytest.param({"sub": "u1", "exp": None}, id="null-exp"),
+        pytest.param({"sub": "u1"}, id="missing-exp"),
+        pytest.param({"exp": LIVE}, id="missing-sub"),
+        pytest.param({"sub": 42, "exp": LIVE}, id="non-string-sub"),
+        pytest.param({"sub": "u1", "exp": LIVE, "iat": "yesterday"}, id="bad-iat"),
+        pytest.param({"sub": "u1", "exp": LIVE, "iat": NOW + 0.5}, id="float-iat"),
+        pytest.param({"sub": "u1", "exp": LIVE, "iat": NOW + HOUR}, id="future-iat"),
+        pytest.param({"sub": "u1", "exp": LIVE, "nbf": NOW + HOUR}, id="future-nbf"),
+        pytest.param({"sub": "u1", "exp": LIVE, "nbf": "later"}, id="bad-nbf"),
+        pytest.param({"sub": "u1", "exp": LIVE, "aud": "other"}, id="aud"),
+        pytest.param({"sub": "u1", "exp": LIVE, "aud": ""}, id="empty-aud"),
+        pytest.param({"sub": "u1", "exp": LIVE, "jti": 7}, id="non-string-jti"),
+        pytest.param({"sub": "u1", "exp": LIVE, "jti": "abc"}, id="jti"),
+    ],
+)
+def test_fast_path_matches_pyjwt(claims):
+    token = auth_jwt._encode_hmac(claims)
+    assert token.startswith(auth_jwt._FAST_DECODE_PREFIX)
+
+    assert _outcome(auth_jwt._decode_hmac, token) == _outcome(_pyjwt_decode, token)
+
+
+def test_fast_path_matches_pyjwt_on_bad_signature():
+    token = auth_jwt._encode_hmac({"sub": "u1", "exp": LIVE})
+    other_signature = auth_jwt._encode_hmac({"sub": "u2"}).rsplit(".", 1)[1]
+    forged = token.rsplit(".", 1)[0] + "." + other_signature
+
+    assert _outcome(auth_jwt._decode_hmac, forged) == _outcome(_pyjwt_decode, forged)
+
+
+def test_encode_matches_pyjwt():
+    claims = {"sub": "u1", "exp": LIVE, "iat": NOW}
+
+    assert _pyjwt_decode(auth_jwt._encode_hmac(claims)) == claims
+
+
+def test_decode_token_caches_valid_payload():
+    token = auth_jwt.create_access_token("u1")
+
+    payload = auth_jwt.decode_token(token)
+
+    assert payload["sub"] == "u1"
+    assert len(auth_jwt.token_cache) == 1
+    assert auth_jwt.decode_token(token) is payload
+
+
+def test_decode_token_rejects_bad_iat_as_invalid_credentials():
+    token = auth_jwt._encode_hmac({"sub": "u1", "exp": LIVE, "iat": "yesterday"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        auth_jwt.decode_token(token)
+
+    assert exc_info.value.status_code == 401
+    assert exc_info.value.detail == "Could not validate credentials"
+    assert len(auth_jwt.token_cache) == 0